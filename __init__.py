@@ -1,14 +1,147 @@
 import importlib
+import importlib.util
 import logging
 import os
 import pkgutil
+import sys
 import time
 import json
+import functools
+import hashlib
+import zlib
+from itertools import compress
+
+# torch is always present inside ComfyUI; the guard only keeps the package
+# importable by tooling that loads it outside a ComfyUI environment
+try:
+    import torch
+except ImportError:
+    torch = None
+
+from .modules.parsers import parse_output, handle_all_inputs
+from .modules.parsers.json_utils import loads as _loads
 
 logger = logging.getLogger("WAS.ContentViewer")
+compose_logger = logging.getLogger("WAS.CanvasComposeBatch")
+
+
+LIST_SEPARATOR = "\n---LIST_SEPARATOR---\n"
+
+
+def to_string(item):
+    """Convert an input item to its display string."""
+    # Exact-type check first: plain str is by far the most common input
+    item_type = type(item)
+    if item_type is str:
+        return item
+    if item is None:
+        return ""
+    if item_type in (int, float, bool):
+        return str(item)
+    if isinstance(item, str):
+        return item
+    if isinstance(item, (int, float, bool)):
+        return str(item)
+    try:
+        return json.dumps(item)
+    except Exception as e:
+        logger.warning("[WAS Viewer] JSON serialization failed: %s", e)
+        try:
+            return str(item)
+        except Exception as e2:
+            logger.error("[WAS Viewer] String conversion failed: %s", e2)
+            return "Content exists but could not be serialized."
+
+
+@functools.lru_cache(maxsize=16)
+def _loads_cached_str(text: str):
+    return _loads(text)
+
+
+def loads_cached(text):
+    """
+    Parse viewer_meta JSON, memoised on the raw string.
+
+    The UI resends identical metadata on most runs, so repeat calls skip parsing.
+    The returned object is shared between calls and must not be mutated.
+    Not for view_state: it can carry multi-MB data URLs the cache would pin.
+    """
+    if type(text) is str:
+        return _loads_cached_str(text)
+    return _loads(text)
+
+
+def to_bytes(item) -> bytes:
+    """UTF-8 bytes of to_string(item), as hashed by compute_input_hash."""
+    return to_string(item).encode("utf-8", errors="replace")
+
+
+def log_preview(item, limit: int = 256) -> str:
+    """Bounded log preview that never calls str() on large objects like tensors."""
+    if isinstance(item, str):
+        return item[:limit]
+    if item is None or isinstance(item, (int, float, bool)):
+        return str(item)
+    shape = getattr(item, "shape", None)
+    if shape is not None:
+        return f"<{type(item).__name__} shape={tuple(shape)}>"[:limit]
+    return f"<{type(item).__name__}>"
+
+
+def has_content(items):
+    """Check if list has non-None, non-empty content without evaluating tensor booleans"""
+    if not items:
+        return False
+    for item in items:
+        if item is None:
+            continue
+        if isinstance(item, str) and not item:
+            continue
+        return True
+    return False
+
+
+def compute_input_hash(content_list):
+    """Compute a hash of input content for change detection."""
+    if not content_list:
+        return ""
+    # Feed items one at a time; digest equals hashing the concatenation
+    hasher = hashlib.md5()
+    fed = False
+    for item in content_list:
+        if item is None:
+            continue
+        item_bytes = to_bytes(item)
+        if item_bytes:
+            hasher.update(item_bytes)
+            fed = True
+    if not fed:
+        return ""
+    return hasher.hexdigest()
+
+
+def filter_excluded(values, excluded):
+    """Drop excluded indices from values, never returning an empty list."""
+    if not excluded:
+        return values or [""]
+    kept = list(compress(values, [i not in excluded for i in range(len(values))]))
+    return kept or [""]
+
+
+def source_content_hash(source_content: str) -> str:
+    """
+    Short length+hash key the frontend uses to detect source changes.
+
+    Uses CRC32: unlike hash(), it is not salted per process, so the key is
+    stable across ComfyUI restarts.
+    """
+    digest = zlib.crc32(source_content.encode("utf-8", errors="replace"))
+    return f"{len(source_content)}_{digest:08x}"
 
 
 class AnyType(str):
+    __slots__ = ()
+
     def __ne__(self, __value: object) -> bool:
         return False
 
@@ -20,19 +153,22 @@ WEB_DIRECTORY = "./web"
 
 
 class WASComfyViewer:
+    # Built once; ComfyUI queries INPUT_TYPES repeatedly during graph validation
+    _INPUT_TYPES = {
+        "required": {},
+        "optional": {
+            "content": (any_type, {"forceInput": True}),
+        },
+        "hidden": {
+            "manual_content": ("STRING", {"default": ""}),
+            "viewer_meta": ("STRING", {"default": "{}"}),
+            "view_state": ("STRING", {"default": "{}"}),
+        },
+    }
+
     @classmethod
     def INPUT_TYPES(cls):
-        return {
-            "required": {},
-            "optional": {
-                "content": (any_type, {"forceInput": True}),
-            },
-            "hidden": {
-                "manual_content": ("STRING", {"default": ""}),
-                "viewer_meta": ("STRING", {"default": "{}"}),
-                "view_state": ("STRING", {"default": "{}"}),
-            },
-        }
+        return cls._INPUT_TYPES
 
     RETURN_TYPES = (any_type,)
     RETURN_NAMES = ("content",)
@@ -43,23 +179,6 @@ class WASComfyViewer:
     CATEGORY = "WAS/View"
 
     def run(self, content=None, manual_content=None, viewer_meta=None, view_state=None):
-        def to_string(item):
-            if item is None:
-                return ""
-            if isinstance(item, str):
-                return item
-            if isinstance(item, (int, float, bool)):
-                return str(item)
-            try:
-                return json.dumps(item)
-            except Exception as e:
-                logger.warning(f"[WAS Viewer] JSON serialization failed: {e}")
-                try:
-                    return str(item)
-                except Exception as e2:
-                    logger.error(f"[WAS Viewer] String conversion failed: {e2}")
-                    return "Content exists but could not be serialized."
-
         if content is None:
             content = []
         if not isinstance(content, list):
@@ -74,62 +193,33 @@ class WASComfyViewer:
         if viewer_meta:
             meta_str = viewer_meta[0] if isinstance(viewer_meta, list) else viewer_meta
             try:
-                parsed = json.loads(meta_str)
+                parsed = loads_cached(meta_str)
                 if isinstance(parsed, dict) and "excluded" in parsed:
                     excluded = (
                         parsed["excluded"]
                         if isinstance(parsed["excluded"], list)
                         else []
                     )
-            except (json.JSONDecodeError, TypeError, KeyError):
+            except (ValueError, TypeError, KeyError):
                 excluded = []
+        # Set lookup keeps the output filter O(N) for large exclusion lists
+        excluded = frozenset(i for i in excluded if isinstance(i, int))
 
-        content_trimmed = [
-            c[:256] if isinstance(c, str) else str(c)[:256] for c in content
-        ]
-        manual_content_trimmed = [
-            c[:256] if isinstance(c, str) else str(c)[:256] for c in manual_content
-        ]
-
-        view_state_trimmed = str(view_state)[:256] if view_state else "None"
-        logger.info(
-            f"\n[WAS Viewer] Content:\n{content_trimmed}\nManual Content:\n{manual_content_trimmed}\nExcluded: {excluded}\nView State: {view_state_trimmed}\n"
-        )
-
-        LIST_SEPARATOR = "\n---LIST_SEPARATOR---\n"
-
-        def has_content(items):
-            """Check if list has non-None, non-empty content without evaluating tensor booleans"""
-            if not items:
-                return False
-            for item in items:
-                if item is None:
-                    continue
-                if isinstance(item, str) and not item:
-                    continue
-                return True
-            return False
+        # Only build the trimmed previews when INFO is actually emitted
+        if logger.isEnabledFor(logging.INFO):
+            content_trimmed = [log_preview(c) for c in content]
+            manual_content_trimmed = [log_preview(c) for c in manual_content]
 
-        # Import parser system
-        from .modules.parsers import parse_output, handle_all_inputs
+            view_state_trimmed = str(view_state)[:256] if view_state else "None"
+            logger.info(
+                "\n[WAS Viewer] Content:\n%s\nManual Content:\n%s\nExcluded: %s\nView State: %s\n",
+                content_trimmed,
+                manual_content_trimmed,
+                sorted(excluded),
+                view_state_trimmed,
+            )
 
         # Compute a hash of the current input content to detect changes
-        import hashlib
-
-        def compute_input_hash(content_list):
-            """Compute a hash of input content for change detection."""
-            if not content_list:
-                return ""
-            combined = ""
-            for item in content_list:
-                if item is None:
-                    continue
-                item_str = to_string(item)
-                combined += item_str
-            if not combined:
-                return ""
-            return hashlib.md5(combined.encode("utf-8", errors="replace")).hexdigest()
-
         current_input_hash = compute_input_hash(content)
 
         # Check view_state for parser output FIRST
@@ -139,8 +229,12 @@ class WASComfyViewer:
             state_str = (
                 to_string(view_state[0]) if len(view_state) == 1 else view_state[0]
             )
+            # Only "_output" keys matter here, and a substring scan is far cheaper
+            # than parsing large states (e.g. embedded base64 images) that lack them
+            if isinstance(state_str, str) and '_output"' not in state_str:
+                state_str = ""
             try:
-                state_data = json.loads(state_str) if state_str else {}
+                state_data = _loads(state_str) if state_str else {}
                 stored_input_hash = state_data.get("_input_hash", "")
 
                 # Use cached _output if:
@@ -169,15 +263,18 @@ class WASComfyViewer:
                                     },
                                     "result": (parsed["output_values"],),
                                 }
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
 
         # Try input handlers (e.g., IMAGE tensors -> canvas view)
         # Use handle_all_inputs to support multi-view content (e.g., tensor can be canvas OR object view)
-        input_handled = handle_all_inputs(content, logger)
+        input_handled = handle_all_inputs(
+            content, logger, fingerprint=current_input_hash or None
+        )
         if input_handled:
             logger.info(
-                f"[WAS Viewer] Input handled by: {input_handled.get('parser_name', 'unknown')}"
+                "[WAS Viewer] Input handled by: %s",
+                input_handled.get("parser_name", "unknown"),
             )
             display_text = input_handled["display_content"]
             source_content = display_text
@@ -185,40 +282,27 @@ class WASComfyViewer:
             output_values = input_handled["output_values"]
         elif has_content(manual_content):
             # Non-parser manual content (parsers already checked above)
-            combined = (
-                to_string(manual_content[0])
-                if len(manual_content) == 1
-                else LIST_SEPARATOR.join(to_string(m) for m in manual_content)
-            )
-            values = (
-                combined.split(LIST_SEPARATOR)
-                if LIST_SEPARATOR in combined
-                else [combined]
-            )
-            logger.info(f"[WAS Viewer] Using manual_content: {len(values)} items")
+            # Each entry may itself hold several separator-joined values, so split
+            # per entry rather than joining everything just to split it again
+            values = [
+                part
+                for m in manual_content
+                for part in to_string(m).split(LIST_SEPARATOR)
+            ]
+            logger.info("[WAS Viewer] Using manual_content: %d items", len(values))
             display_text = LIST_SEPARATOR.join(values)
             source_content = (
                 LIST_SEPARATOR.join(to_string(c) for c in content) if content else ""
             )
-            content_hash = (
-                str(len(source_content)) + "_" + str(hash(source_content) & 0xFFFFFFFF)
-            )
-            output_values = [v for i, v in enumerate(values) if i not in excluded]
-            if not output_values:
-                output_values = [""]
+            content_hash = source_content_hash(source_content)
+            output_values = filter_excluded(values, excluded)
         elif has_content(content):
             values = [to_string(c) for c in content]
-            logger.info(f"[WAS Viewer] Using content input: {len(values)} items")
-            display_text = LIST_SEPARATOR.join(values)
-            source_content = (
-                LIST_SEPARATOR.join(to_string(c) for c in content) if content else ""
-            )
-            content_hash = (
-                str(len(source_content)) + "_" + str(hash(source_content) & 0xFFFFFFFF)
-            )
-            output_values = [v for i, v in enumerate(values) if i not in excluded]
-            if not output_values:
-                output_values = [""]
+            logger.info("[WAS Viewer] Using content input: %d items", len(values))
+            # values are already the stringified content, so both views share one join
+            display_text = source_content = LIST_SEPARATOR.join(values)
+            content_hash = source_content_hash(source_content)
+            output_values = filter_excluded(values, excluded)
         else:
             values = [""]
             logger.info("[WAS Viewer] No content, using empty")
@@ -241,37 +325,47 @@ class WASComfyViewer:
 class WASCanvasComposeBatch:
     """Combines two image batches, padding all images with transparency to the largest size."""
 
+    _INPUT_TYPES = {
+        "required": {},
+        "optional": {
+            "images_a": ("IMAGE",),
+            "images_b": ("IMAGE",),
+        },
+    }
+
     @classmethod
     def INPUT_TYPES(cls):
-        return {
-            "required": {},
-            "optional": {
-                "images_a": ("IMAGE",),
-                "images_b": ("IMAGE",),
-            },
-        }
+        return cls._INPUT_TYPES
 
     RETURN_TYPES = ("IMAGE",)
     RETURN_NAMES = ("images",)
     FUNCTION = "run"
     CATEGORY = "WAS/View"
 
-    def run(self, images_a=None, images_b=None):
-        import torch
-        import logging
+    @staticmethod
+    def _write_opaque_rgba(dst, img):
+        """
+        Copy an [H, W, C] image into an [H, W, 4] view as RGB plus solid alpha.
 
-        logger = logging.getLogger("WAS.CanvasComposeBatch")
+        Missing color channels are zero-filled. The slice assignment converts
+        device and dtype during the copy, so no intermediate tile is built.
+        """
+        c = min(img.shape[-1], 3)
+        dst[..., :c] = img[..., :c]
+        if c < 3:
+            dst[..., c:3] = 0.0
+        dst[..., 3] = 1.0
 
+    def run(self, images_a=None, images_b=None):
         all_images = []
 
         def add_batch(batch):
             if batch is None:
                 return
-            if hasattr(batch, "shape"):
-                if len(batch.shape) == 4:
-                    for i in range(batch.shape[0]):
-                        all_images.append(batch[i])
-                elif len(batch.shape) == 3:
+            if isinstance(batch, torch.Tensor):
+                if batch.dim() == 4:
+                    all_images.extend(batch.unbind(0))
+                elif batch.dim() == 3:
                     all_images.append(batch)
 
         add_batch(images_a)
@@ -283,22 +377,30 @@ class WASCanvasComposeBatch:
         max_h = max(img.shape[0] for img in all_images)
         max_w = max(img.shape[1] for img in all_images)
 
-        logger.info(
-            f"[WAS CanvasComposeBatch] Padding {len(all_images)} images to {max_w}x{max_h}"
+        compose_logger.info(
+            "[WAS CanvasComposeBatch] Padding %d images to %dx%d",
+            len(all_images),
+            max_w,
+            max_h,
         )
 
-        padded_images = []
+        first = all_images[0]
 
-        for img in all_images:
-            h, w, c = img.shape
-            padded = torch.zeros((max_h, max_w, 4), dtype=img.dtype, device=img.device)
+        # Write every image straight into one preallocated batch. Uniform
+        # batches fill every pixel, so only padded batches need zeroing
+        uniform = all(img.shape[:2] == first.shape[:2] for img in all_images)
+        alloc = torch.empty if uniform else torch.zeros
+        result = alloc(
+            (len(all_images), max_h, max_w, 4), dtype=first.dtype, device=first.device
+        )
+
+        for i, img in enumerate(all_images):
+            h, w = img.shape[0], img.shape[1]
             y_offset = (max_h - h) // 2
             x_offset = (max_w - w) // 2
-            padded[y_offset : y_offset + h, x_offset : x_offset + w, :c] = img
-            padded[y_offset : y_offset + h, x_offset : x_offset + w, 3] = 1.0
-            padded_images.append(padded)
-
-        result = torch.stack(padded_images, dim=0)
+            self._write_opaque_rgba(
+                result[i, y_offset : y_offset + h, x_offset : x_offset + w], img
+            )
 
         return (result,)
 
@@ -321,6 +423,7 @@ class NodeLoader:
         self.package_name = package_name
         self.prefix = prefix
         self.logger = logging.getLogger("WAS.ContentViewer.NodeLoader")
+        # module file -> (elapsed seconds from a monotonic clock, ok, error)
         self.timings: dict[str, tuple[float, bool, Exception | None]] = {}
 
     def module_path(self, module) -> str:
@@ -340,7 +443,7 @@ class NodeLoader:
     def import_module(
         self, fullname: str, package: str | None = None
     ) -> tuple[object | None, bool]:
-        t0 = time.time()
+        t0 = time.perf_counter_ns()
         ok = True
         err = None
         mod = None
@@ -350,7 +453,7 @@ class NodeLoader:
             ok = False
             err = e
             self.logger.error(f"{self.prefix}Failed to import {fullname}: {e}")
-        elapsed = time.time() - t0
+        elapsed = (time.perf_counter_ns() - t0) * 1e-9
         if mod is not None:
             self.record(mod, elapsed, ok, err)
         return mod, ok
@@ -359,9 +462,7 @@ class NodeLoader:
         self, filepath: str, module_name: str
     ) -> tuple[object | None, bool]:
         """Load a .py file directly by path without requiring package structure."""
-        import importlib.util
-
-        t0 = time.time()
+        t0 = time.perf_counter_ns()
         ok = True
         err = None
         mod = None
@@ -369,19 +470,26 @@ class NodeLoader:
             spec = importlib.util.spec_from_file_location(module_name, filepath)
             if spec and spec.loader:
                 mod = importlib.util.module_from_spec(spec)
-                import sys
-
                 sys.modules[module_name] = mod
                 spec.loader.exec_module(mod)
         except Exception as e:
             ok = False
             err = e
             self.logger.error(f"{self.prefix}Failed to import {filepath}: {e}")
-        elapsed = time.time() - t0
+        elapsed = (time.perf_counter_ns() - t0) * 1e-9
         if mod is not None:
             self.record(mod, elapsed, ok, err)
         return mod, ok
 
+    def import_submodules(self, package) -> None:
+        """Import and record every submodule of a package, recursing into packages."""
+        for _, name, ispkg in pkgutil.iter_modules(
+            package.__path__, prefix=package.__name__ + "."
+        ):
+            mod, ok = self.import_module(name)
+            if ispkg and ok and mod is not None:
+                self.import_submodules(mod)
+
     def load_all(self) -> None:
         package_path = os.path.dirname(__file__)
         nodes_path = os.path.join(package_path, "nodes")
@@ -389,27 +497,31 @@ class NodeLoader:
         if not os.path.isdir(nodes_path):
             return
 
+        # Single directory scan; DirEntry caches the file type for both passes
+        with os.scandir(nodes_path) as it:
+            entries = list(it)
+
         # Load .py files directly from nodes folder (no __init__.py required)
-        for filename in os.listdir(nodes_path):
-            if filename.endswith(".py") and not filename.startswith("_"):
-                filepath = os.path.join(nodes_path, filename)
+        for entry in entries:
+            filename = entry.name
+            if (
+                filename.endswith(".py")
+                and not filename.startswith("_")
+                and entry.is_file()
+            ):
                 module_name = f"{self.package_name}.nodes.{filename[:-3]}"
-                self.import_file(filepath, module_name)
+                self.import_file(entry.path, module_name)
 
         # Walk subpackages if they exist (folders with __init__.py)
-        for item in os.listdir(nodes_path):
-            item_path = os.path.join(nodes_path, item)
-            if os.path.isdir(item_path) and os.path.isfile(
-                os.path.join(item_path, "__init__.py")
+        for entry in entries:
+            if entry.is_dir() and os.path.isfile(
+                os.path.join(entry.path, "__init__.py")
             ):
                 subpkg, ok = self.import_module(
-                    f".nodes.{item}", package=self.package_name
+                    f".nodes.{entry.name}", package=self.package_name
                 )
                 if ok and subpkg is not None:
-                    for _, name, _ in pkgutil.walk_packages(
-                        subpkg.__path__, prefix=subpkg.__name__ + "."
-                    ):
-                        self.import_module(name)
+                    self.import_submodules(subpkg)
 
         # Log summary
         if self.timings:
@@ -433,10 +545,10 @@ class NodeLoader:
 _loader = NodeLoader(package_name=__name__, prefix="[WAS Viewer] ")
 _loader.load_all()
 
-# Load API routes from extensions
-try:
+# Load API routes from extensions; errors inside routes are not swallowed
+if importlib.util.find_spec(f"{__name__}.routes") is not None:
     from . import routes
-except ImportError:
+else:
     logger.info("[WAS Viewer] No routes directory found, skipping route loading")
 
 __all__ = ["NODE_CLASS_MAPPINGS", "NODE_DISPLAY_NAME_MAPPINGS", "WEB_DIRECTORY"]
@@ -8,25 +8,161 @@ The loader discovers BaseParser subclasses and registers them automatically.
 """
 
 import os
-import inspect
+import sys
 import importlib
+import inspect
 import logging
 
 from .base_parser import BaseParser
+from .json_utils import JSONDecodeError as _JSONDecodeError
+from .json_utils import dumps as _dumps
+from .json_utils import loads as _loads
 
 logger = logging.getLogger("WAS.ContentViewer.Parsers")
 
 _parsers = []
 _loaded = False
 
+# Capability bits: which BaseParser hooks a parser actually overrides
+CAP_INPUT = 1
+CAP_OUTPUT = 2
+CAP_STATE = 4
+CAP_DISPLAY = 8
+CAP_DEFAULTS = 16
+
+_CAPABILITY_HOOKS = (
+    (CAP_INPUT, "detect_input"),
+    (CAP_OUTPUT, "detect_output"),
+    (CAP_STATE, "detect_state"),
+    (CAP_DISPLAY, "detect_display_content"),
+    (CAP_DEFAULTS, "get_default_outputs"),
+)
+
+# Priority-ordered parsers per capability, rebuilt by load_parsers()
+_state_parsers = ()
+_display_parsers = ()
+_default_output_parsers = ()
+
+# Highest-priority parser per PARSER_NAME
+_parsers_by_name = {}
+
+# Priority-ordered (marker, parser) pairs; marker is None when a parser
+# overrides detect_output and must be asked directly
+_output_dispatch = ()
+_output_markers = ()
+_output_has_custom = False
+
+# Priority-ordered (detect_input, ignored item types, exclusive, parser) rows,
+# unpacked once at load so detection loops skip per-call dict/attribute lookups
+_input_dispatch = ()
+_input_any_ignore = False
+
+
+def _parser_capabilities(parser_class) -> int:
+    """Bitmask of the CAP_* hooks parser_class overrides from BaseParser."""
+    caps = 0
+    for bit, hook in _CAPABILITY_HOOKS:
+        func = getattr(getattr(parser_class, hook, None), "__func__", None)
+        if func is not getattr(BaseParser, hook).__func__:
+            caps |= bit
+    if parser_class.OUTPUT_MARKER:
+        caps |= CAP_OUTPUT
+    return caps
+
+
+def _accepts_fingerprint(func) -> bool:
+    """True if a handle_input implementation takes the fingerprint keyword."""
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return "fingerprint" in params or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
+def _call_handle_input(parser, content, logger, fingerprint):
+    """Call a parser's handle_input, passing fingerprint only if it accepts one."""
+    if fingerprint and parser.accepts_fingerprint:
+        return parser.handle_input(content, logger, fingerprint=fingerprint)
+    return parser.handle_input(content, logger)
+
+
+class ParserInfo:
+    """
+    Registry record for one parser class.
+
+    Hooks are bound once at registration so dispatch reads plain attributes.
+    Item access (info["name"], info["class"]) is kept for code written
+    against the earlier dict records.
+    """
+
+    __slots__ = (
+        "name",
+        "priority",
+        "cls",
+        "detect_input",
+        "handle_input",
+        "detect_output",
+        "parse_output",
+        "caps",
+        "accepts_fingerprint",
+    )
+
+    def __init__(self, parser_class):
+        self.name = parser_class.PARSER_NAME
+        self.priority = parser_class.PARSER_PRIORITY
+        self.cls = parser_class
+        self.detect_input = parser_class.detect_input
+        self.handle_input = parser_class.handle_input
+        self.detect_output = parser_class.detect_output
+        self.parse_output = parser_class.parse_output
+        self.caps = _parser_capabilities(parser_class)
+        self.accepts_fingerprint = _accepts_fingerprint(parser_class.handle_input)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, "cls" if key == "class" else key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __repr__(self):
+        return f"ParserInfo({self.name!r}, priority={self.priority})"
+
+
+def _register_parsers_from_module(module, source_name: str = None):
+    """Build ParserInfo records for every BaseParser subclass defined in module."""
+    loaded = []
+    # vars() avoids inspect.getmembers' getattr-per-name and sort
+    for obj in list(vars(module).values()):
+        if not isinstance(obj, type) or obj is BaseParser:
+            continue
+        if not issubclass(obj, BaseParser):
+            continue
+
+        parser_info = ParserInfo(obj)
+
+        loaded.append(parser_info)
+        source = f" from {source_name}" if source_name else ""
+        logger.info(
+            f"[Parsers] Loaded parser: {obj.PARSER_NAME} (priority {obj.PARSER_PRIORITY}){source}"
+        )
+    return loaded
+
 
 def _load_parser_from_file(filepath: str, source_name: str = "local"):
-    """Load parser classes from a specific file path."""
+    """
+    Load parser classes from a specific file path.
+
+    The module is registered as a submodule of this package, so a parser's
+    ``from .base_parser import BaseParser`` resolves to the shared BaseParser.
+    """
     import importlib.util
 
     loaded = []
     filename = os.path.basename(filepath)
-    module_name = filename[:-3]
+    source_tag = "".join(c if c.isalnum() else "_" for c in source_name)
+    module_name = f"{__name__}._{source_tag}_{filename[:-3]}"
 
     try:
         spec = importlib.util.spec_from_file_location(module_name, filepath)
@@ -34,28 +170,14 @@ def _load_parser_from_file(filepath: str, source_name: str = "local"):
             return loaded
 
         module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if obj is BaseParser:
-                continue
-            if not issubclass(obj, BaseParser):
-                continue
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
 
-            parser_info = {
-                "name": obj.PARSER_NAME,
-                "priority": obj.PARSER_PRIORITY,
-                "class": obj,
-                "detect_input": obj.detect_input,
-                "handle_input": obj.handle_input,
-                "detect_output": obj.detect_output,
-                "parse_output": obj.parse_output,
-            }
-
-            loaded.append(parser_info)
-            logger.info(
-                f"[Parsers] Loaded parser: {obj.PARSER_NAME} (priority {obj.PARSER_PRIORITY}) from {source_name}"
-            )
+        loaded = _register_parsers_from_module(module, source_name)
 
     except Exception as e:
         logger.error(f"[Parsers] Failed to load {filename} from {source_name}: {e}")
@@ -63,6 +185,67 @@ def _load_parser_from_file(filepath: str, source_name: str = "local"):
     return loaded
 
 
+def _scan_dir(path: str):
+    """
+    List a directory as (name, path, is_dir) tuples, or [] if it can't be read.
+
+    is_dir comes from the scandir entry, so callers need no extra stat per entry.
+    """
+    try:
+        with os.scandir(path) as it:
+            return [(e.name, e.path, e.is_dir()) for e in it]
+    except OSError:
+        return []
+
+
+def _build_dispatch_tables():
+    """
+    Precompute per-capability parser lists and the OUTPUT_MARKER index.
+
+    Dispatch then only visits parsers that override the relevant hook, and
+    output detection becomes a prefix match rather than P detect_output calls.
+    """
+    global _state_parsers, _display_parsers, _default_output_parsers
+    global _output_dispatch, _output_markers, _output_has_custom
+    global _input_dispatch, _input_any_ignore, _parsers_by_name
+
+    _input_dispatch = tuple(
+        (
+            p.detect_input,
+            p.cls.INPUT_IGNORE_TYPES,
+            p.cls.PARSER_EXCLUSIVE,
+            p,
+        )
+        for p in _parsers
+        if p.caps & CAP_INPUT
+    )
+    _input_any_ignore = any(row[1] for row in _input_dispatch)
+    _state_parsers = tuple(p for p in _parsers if p.caps & CAP_STATE)
+    _display_parsers = tuple(p for p in _parsers if p.caps & CAP_DISPLAY)
+    _default_output_parsers = tuple(p for p in _parsers if p.caps & CAP_DEFAULTS)
+
+    by_name = {}
+    for parser in _parsers:
+        by_name.setdefault(parser.name, parser)
+    _parsers_by_name = by_name
+
+    dispatch = []
+    for parser in _parsers:
+        parser_class = parser.cls
+        uses_default = (
+            parser_class.detect_output.__func__ is BaseParser.detect_output.__func__
+        )
+        if uses_default:
+            if parser_class.OUTPUT_MARKER:
+                dispatch.append((parser_class.OUTPUT_MARKER, parser))
+        else:
+            dispatch.append((None, parser))
+
+    _output_dispatch = tuple(dispatch)
+    _output_markers = tuple(m for m, _ in dispatch if m is not None)
+    _output_has_custom = any(m is None for m, _ in dispatch)
+
+
 def load_parsers():
     """Load all parser classes from this directory and development extensions."""
     global _parsers, _loaded
@@ -74,7 +257,7 @@ def load_parsers():
     package_name = __name__
 
     # Load parsers from this directory (installed parsers)
-    for filename in os.listdir(parsers_dir):
+    for filename, _, _ in _scan_dir(parsers_dir):
         if not filename.endswith("_parser.py") or filename == "base_parser.py":
             continue
 
@@ -83,27 +266,7 @@ def load_parsers():
 
         try:
             module = importlib.import_module(full_module_name)
-
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if obj is BaseParser:
-                    continue
-                if not issubclass(obj, BaseParser):
-                    continue
-
-                parser_info = {
-                    "name": obj.PARSER_NAME,
-                    "priority": obj.PARSER_PRIORITY,
-                    "class": obj,
-                    "detect_input": obj.detect_input,
-                    "handle_input": obj.handle_input,
-                    "detect_output": obj.detect_output,
-                    "parse_output": obj.parse_output,
-                }
-
-                _parsers.append(parser_info)
-                logger.info(
-                    f"[Parsers] Loaded parser: {obj.PARSER_NAME} (priority {obj.PARSER_PRIORITY})"
-                )
+            _parsers.extend(_register_parsers_from_module(module))
 
         except Exception as e:
             logger.error(f"[Parsers] Failed to load {filename}: {e}")
@@ -113,30 +276,28 @@ def load_parsers():
     workspace_dir = os.path.dirname(
         os.path.dirname(os.path.dirname(parsers_dir))
     )  # Go up to workspace
-    if os.path.isdir(workspace_dir):
-        loaded_names = {p["name"] for p in _parsers}
+    # _scan_dir returns [] for a missing directory and reports each entry's
+    # is_dir, so no per-entry isdir() stat is needed
+    loaded_names = {p.name for p in _parsers}
 
-        for entry in os.listdir(workspace_dir):
-            if not entry.startswith("ComfyUI_Viewer_"):
-                continue
+    for entry, entry_path, is_dir in _scan_dir(workspace_dir):
+        if not is_dir or not entry.startswith("ComfyUI_Viewer_"):
+            continue
 
-            ext_parsers_dir = os.path.join(workspace_dir, entry, "modules", "parsers")
-            if not os.path.isdir(ext_parsers_dir):
+        ext_parsers_dir = os.path.join(entry_path, "modules", "parsers")
+        for filename, filepath, _ in _scan_dir(ext_parsers_dir):
+            if not filename.endswith("_parser.py") or filename == "base_parser.py":
                 continue
 
-            for filename in os.listdir(ext_parsers_dir):
-                if not filename.endswith("_parser.py") or filename == "base_parser.py":
-                    continue
-
-                filepath = os.path.join(ext_parsers_dir, filename)
-                ext_parsers = _load_parser_from_file(filepath, f"dev:{entry}")
+            ext_parsers = _load_parser_from_file(filepath, f"dev:{entry}")
 
-                for parser_info in ext_parsers:
-                    if parser_info["name"] not in loaded_names:
-                        _parsers.append(parser_info)
-                        loaded_names.add(parser_info["name"])
+            for parser_info in ext_parsers:
+                if parser_info.name not in loaded_names:
+                    _parsers.append(parser_info)
+                    loaded_names.add(parser_info.name)
 
-    _parsers.sort(key=lambda p: p["priority"], reverse=True)
+    _parsers.sort(key=lambda p: p.priority, reverse=True)
+    _build_dispatch_tables()
     _loaded = True
 
     return _parsers
@@ -151,47 +312,77 @@ def get_parsers():
 
 def get_parser_by_name(name: str):
     """Get a specific parser by name."""
-    for parser in get_parsers():
-        if parser["name"] == name:
-            return parser
-    return None
+    if not _loaded:
+        load_parsers()
+    return _parsers_by_name.get(name)
 
 
 def get_all_parser_names():
     """Get list of all loaded parser names."""
-    return [p["name"] for p in get_parsers()]
+    return [p.name for p in get_parsers()]
+
+
+def _input_candidates(content):
+    """
+    Input dispatch rows whose detect_input could match content.
+
+    Parsers that declare INPUT_IGNORE_TYPES are skipped without calling
+    detect_input when every item in content is one of those types.
+    """
+    if not _input_any_ignore:
+        return _input_dispatch
+    items = content if isinstance(content, (list, tuple)) else [content]
+    item_types = {type(item) for item in items if item is not None}
+    return [
+        row
+        for row in _input_dispatch
+        if not row[1] or not all(issubclass(t, row[1]) for t in item_types)
+    ]
 
 
 def find_input_handler(content):
     """Find the first parser that can handle this input content."""
-    for parser in get_parsers():
-        if not parser["detect_input"]:
-            continue
+    if not _loaded:
+        load_parsers()
+
+    for detect, _, _, parser in _input_candidates(content):
         try:
-            if parser["detect_input"](content):
+            if detect(content):
                 return parser
         except Exception as e:
-            logger.error(f"[Parsers] Error in {parser['name']}.detect_input(): {e}")
+            logger.error(f"[Parsers] Error in {parser.name}.detect_input(): {e}")
     return None
 
 
 def find_output_parser(content: str):
     """Find the first parser that can parse this output content."""
-    for parser in get_parsers():
-        if not parser["detect_output"]:
+    if not _loaded:
+        load_parsers()
+
+    is_str = isinstance(content, str)
+    if not _output_has_custom and not (is_str and content.startswith(_output_markers)):
+        return None
+
+    for marker, parser in _output_dispatch:
+        if marker is not None:
+            if is_str and content.startswith(marker):
+                return parser
             continue
         try:
-            if parser["detect_output"](content):
+            if parser.detect_output(content):
                 return parser
         except Exception as e:
-            logger.error(f"[Parsers] Error in {parser['name']}.detect_output(): {e}")
+            logger.error(f"[Parsers] Error in {parser.name}.detect_output(): {e}")
     return None
 
 
-def handle_input(content, logger=None):
+def handle_input(content, logger=None, fingerprint=None):
     """
     Try to handle input content using available parsers.
 
+    fingerprint is an optional precomputed hash of content, forwarded to
+    parsers whose handle_input accepts it so they need not hash it again.
+
     Returns:
         dict with keys: display_content, output_values, content_hash
         or None if no parser matched
@@ -201,13 +392,13 @@ def handle_input(content, logger=None):
         return None
 
     try:
-        result = parser["handle_input"](content, logger)
+        result = _call_handle_input(parser, content, logger, fingerprint)
         if result:
-            result["parser_name"] = parser["name"]
+            result["parser_name"] = parser.name
         return result
     except Exception as e:
         if logger:
-            logger.error(f"[Parsers] Error in {parser['name']}.handle_input(): {e}")
+            logger.error(f"[Parsers] Error in {parser.name}.handle_input(): {e}")
         return None
 
 
@@ -216,23 +407,29 @@ MULTIVIEW_MARKER = "$WAS_MULTIVIEW$"
 
 def find_all_input_handlers(content):
     """Find ALL parsers that can handle this input content."""
+    if not _loaded:
+        load_parsers()
+
     handlers = []
-    for parser in get_parsers():
-        if not parser["detect_input"]:
-            continue
+    for detect, _, exclusive, parser in _input_candidates(content):
         try:
-            if parser["detect_input"](content):
+            if detect(content):
                 handlers.append(parser)
+                # An exclusive match suppresses lower-priority alternative views
+                if exclusive:
+                    break
         except Exception as e:
-            logger.error(f"[Parsers] Error in {parser['name']}.detect_input(): {e}")
+            logger.error(f"[Parsers] Error in {parser.name}.detect_input(): {e}")
     return handlers
 
 
-def handle_all_inputs(content, logger=None):
+def handle_all_inputs(content, logger=None, fingerprint=None):
     """
     Try to handle input content using ALL matching parsers.
     Returns multi-view payload if multiple parsers match.
 
+    fingerprint is forwarded as in handle_input().
+
     Returns:
         dict with keys:
             - If single match: display_content, output_values, content_hash, parser_name
@@ -240,8 +437,6 @@ def handle_all_inputs(content, logger=None):
                              content_hash, views (list of view data)
         or None if no parser matched
     """
-    import json
-
     handlers = find_all_input_handlers(content)
 
     if not handlers:
@@ -251,13 +446,13 @@ def handle_all_inputs(content, logger=None):
     if len(handlers) == 1:
         parser = handlers[0]
         try:
-            result = parser["handle_input"](content, logger)
+            result = _call_handle_input(parser, content, logger, fingerprint)
             if result:
-                result["parser_name"] = parser["name"]
+                result["parser_name"] = parser.name
             return result
         except Exception as e:
             if logger:
-                logger.error(f"[Parsers] Error in {parser['name']}.handle_input(): {e}")
+                logger.error(f"[Parsers] Error in {parser.name}.handle_input(): {e}")
             return None
 
     # Multiple handlers - create multi-view payload
@@ -266,11 +461,11 @@ def handle_all_inputs(content, logger=None):
 
     for parser in handlers:
         try:
-            result = parser["handle_input"](content, logger)
+            result = _call_handle_input(parser, content, logger, fingerprint)
             if result:
                 view_data = {
-                    "name": parser["name"],
-                    "priority": parser["priority"],
+                    "name": parser.name,
+                    "priority": parser.priority,
                     "display_content": result.get("display_content", ""),
                     "content_hash": result.get("content_hash", ""),
                 }
@@ -281,7 +476,7 @@ def handle_all_inputs(content, logger=None):
                     output_values = result.get("output_values", [])
         except Exception as e:
             if logger:
-                logger.error(f"[Parsers] Error in {parser['name']}.handle_input(): {e}")
+                logger.error(f"[Parsers] Error in {parser.name}.handle_input(): {e}")
 
     if not views:
         return None
@@ -301,7 +496,7 @@ def handle_all_inputs(content, logger=None):
         logger.info(f"[Parsers] Multi-view content detected: {view_names}")
 
     return {
-        "display_content": MULTIVIEW_MARKER + json.dumps(multiview_data),
+        "display_content": MULTIVIEW_MARKER + _dumps(multiview_data),
         "output_values": output_values,
         "content_hash": f"multiview_{len(views)}_{views[0]['content_hash']}",
         "parser_name": "multiview",
@@ -323,13 +518,13 @@ def parse_output(content: str, logger=None):
         return None
 
     try:
-        result = parser["parse_output"](content, logger)
+        result = parser.parse_output(content, logger)
         if result:
-            result["parser_name"] = parser["name"]
+            result["parser_name"] = parser.name
         return result
     except Exception as e:
         if logger:
-            logger.error(f"[Parsers] Error in {parser['name']}.parse_output(): {e}")
+            logger.error(f"[Parsers] Error in {parser.name}.parse_output(): {e}")
         return None
 
 
@@ -337,18 +532,46 @@ def find_state_parser(state_data: dict):
     """Find the first parser that can handle this state data."""
     if not isinstance(state_data, dict):
         return None
-    for parser in get_parsers():
-        parser_class = parser["class"]
-        if not hasattr(parser_class, "detect_state"):
-            continue
+    if not _loaded:
+        load_parsers()
+    for parser in _state_parsers:
         try:
-            if parser_class.detect_state(state_data):
+            if parser.cls.detect_state(state_data):
                 return parser
         except Exception as e:
-            logger.error(f"[Parsers] Error in {parser['name']}.detect_state(): {e}")
+            logger.error(f"[Parsers] Error in {parser.name}.detect_state(): {e}")
     return None
 
 
+def _decode_state(raw):
+    """Decode a JSON str/bytes state layer; non-text values pass through."""
+    if not isinstance(raw, (str, bytes, bytearray, memoryview)):
+        return raw
+    if isinstance(raw, memoryview):
+        raw = raw.tobytes()
+    try:
+        return _loads(raw)
+    except _JSONDecodeError:
+        return None
+
+
+def _coerce_state(state_data):
+    """
+    Normalize state data to a dict, or None.
+
+    Accepts a dict, a JSON str/bytes, or a list wrapping either (as widget
+    values arrive with INPUT_IS_LIST). Each layer is decoded at most once.
+    """
+    if type(state_data) is dict:
+        return state_data
+    if not state_data or state_data == "{}" or state_data == b"{}":
+        return None
+    state_data = _decode_state(state_data)
+    if isinstance(state_data, list):
+        state_data = _decode_state(state_data[0]) if state_data else None
+    return state_data if isinstance(state_data, dict) else None
+
+
 def parse_state(state_data, logger=None):
     """
     Try to parse state data using available parsers.
@@ -360,25 +583,14 @@ def parse_state(state_data, logger=None):
     Returns:
         dict with parser-specific keys, or None if no parser matched
     """
-    import json
-
-    if isinstance(state_data, str):
-        if not state_data or state_data == "{}":
-            return None
-        try:
-            state_data = json.loads(state_data)
-        except json.JSONDecodeError:
-            return None
-
-    if isinstance(state_data, list):
-        state_data = state_data[0] if state_data else None
-        if isinstance(state_data, str):
-            try:
-                state_data = json.loads(state_data)
-            except json.JSONDecodeError:
-                return None
+    if not _loaded:
+        load_parsers()
+    # Without state parsers there is nothing to hand the decoded state to
+    if not _state_parsers:
+        return None
 
-    if not isinstance(state_data, dict):
+    state_data = _coerce_state(state_data)
+    if state_data is None:
         return None
 
     parser = find_state_parser(state_data)
@@ -386,28 +598,27 @@ def parse_state(state_data, logger=None):
         return None
 
     try:
-        result = parser["class"].parse_state(state_data, logger)
+        result = parser.cls.parse_state(state_data, logger)
         if result:
-            result["parser_name"] = parser["name"]
+            result["parser_name"] = parser.name
         return result
     except Exception as e:
         if logger:
-            logger.error(f"[Parsers] Error in {parser['name']}.parse_state(): {e}")
+            logger.error(f"[Parsers] Error in {parser.name}.parse_state(): {e}")
         return None
 
 
 def find_display_handler(content):
     """Find the first parser that can prepare display content for this input."""
-    for parser in get_parsers():
-        parser_class = parser["class"]
-        if not hasattr(parser_class, "detect_display_content"):
-            continue
+    if not _loaded:
+        load_parsers()
+    for parser in _display_parsers:
         try:
-            if parser_class.detect_display_content(content):
+            if parser.cls.detect_display_content(content):
                 return parser
         except Exception as e:
             logger.error(
-                f"[Parsers] Error in {parser['name']}.detect_display_content(): {e}"
+                f"[Parsers] Error in {parser.name}.detect_display_content(): {e}"
             )
     return None
 
@@ -425,13 +636,13 @@ def prepare_display(content, logger=None):
         return None
 
     try:
-        result = parser["class"].prepare_display(content, logger)
+        result = parser.cls.prepare_display(content, logger)
         if result:
-            result["parser_name"] = parser["name"]
+            result["parser_name"] = parser.name
         return result
     except Exception as e:
         if logger:
-            logger.error(f"[Parsers] Error in {parser['name']}.prepare_display(): {e}")
+            logger.error(f"[Parsers] Error in {parser.name}.prepare_display(): {e}")
         return None
 
 
@@ -447,17 +658,18 @@ def get_default_outputs(content, output_types: list, logger=None):
     Returns:
         tuple of default values, or None if no parser matched
     """
-    for parser in get_parsers():
-        parser_class = parser["class"]
-        if not hasattr(parser_class, "get_default_outputs"):
-            continue
+    if not _loaded:
+        load_parsers()
+    for parser in _default_output_parsers:
         try:
-            result = parser_class.get_default_outputs(content, output_types, logger)
+            result = parser.cls.get_default_outputs(
+                content, output_types, logger
+            )
             if result is not None:
                 return result
         except Exception as e:
             if logger:
                 logger.error(
-                    f"[Parsers] Error in {parser['name']}.get_default_outputs(): {e}"
+                    f"[Parsers] Error in {parser.name}.get_default_outputs(): {e}"
                 )
     return None
@@ -7,8 +7,12 @@ registers subclasses automatically from *_parser.py files.
 Parser Interface:
 - PARSER_NAME: str - Unique identifier matching frontend view id
 - PARSER_PRIORITY: int - Higher priority parsers are checked first
+- PARSER_EXCLUSIVE: bool - If True, a match stops lower-priority parsers from
+  being offered as alternative views (skips their detect/handle calls)
+- INPUT_IGNORE_TYPES: tuple - Item types detect_input never matches; when all
+  input items are of these types detect_input is not called at all
 - detect_input(content) -> bool - Returns True if this parser handles this input
-- handle_input(content, logger) -> dict - Process input for display
+- handle_input(content, logger, fingerprint=None) -> dict - Process input for display
 - detect_output(content: str) -> bool - Returns True if content has output marker
 - parse_output(content: str, logger) -> dict - Convert output to backend types
 """
@@ -26,6 +30,8 @@ class BaseParser(ABC):
 
     PARSER_NAME: str = "base"
     PARSER_PRIORITY: int = 0
+    PARSER_EXCLUSIVE: bool = False
+    INPUT_IGNORE_TYPES: tuple = ()
     OUTPUT_MARKER: str = None
 
     @classmethod
@@ -39,10 +45,14 @@ class BaseParser(ABC):
         return False
 
     @classmethod
-    def handle_input(cls, content, logger=None) -> dict:
+    def handle_input(cls, content, logger=None, fingerprint=None) -> dict:
         """
         Process input content for display.
 
+        fingerprint, when given, is a stable hash of content computed by the
+        caller; parsers may use it in content_hash instead of rehashing.
+        Overrides without this parameter are called without it.
+
         Returns:
             dict with keys:
                 - display_content: str - Content for frontend
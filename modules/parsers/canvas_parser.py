@@ -7,14 +7,91 @@ Handles both:
 
 """
 
-import base64
 import io
 import os
-import json
 import uuid
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from .base_parser import BaseParser
+from .json_utils import dumps as _dumps
+
+# pybase64 is a drop-in with SIMD codecs; composites and previews are large
+try:
+    from pybase64 import b64decode, b64encode
+except ImportError:
+    from base64 import b64decode, b64encode
+
+# Image hashes only name files within a session, so a fast non-cryptographic
+# hash is enough; both variants hash the pixel buffer without copying it
+try:
+    import xxhash
+
+    def _image_digest(buffer) -> str:
+        return xxhash.xxh3_64_hexdigest(buffer)[:12]
+
+except ImportError:
+
+    def _image_digest(buffer) -> str:
+        return hashlib.blake2b(buffer, digest_size=6).hexdigest()
+
+
+# Canvas PNGs favour encode speed over size; level 3 is several times faster
+# than the default 6 on large frames for a few percent larger output
+PNG_COMPRESS_LEVEL = 3
+
+
+# Accepted IMAGE tensor ranks ([H,W,C] / [B,H,W,C]) and channel counts
+_IMAGE_NDIMS = frozenset((3, 4))
+_IMAGE_CHANNELS = frozenset((1, 3, 4))
+
+
+_thread_state = threading.local()
+
+
+def _png_buffer():
+    """
+    This thread's reusable PNG BytesIO, rewound for a new image.
+
+    It is rewound rather than truncated: truncating a BytesIO frees its
+    allocation, which is the reallocation this reuse avoids.
+    """
+    buffer = getattr(_thread_state, "png_buffer", None)
+    if buffer is None:
+        buffer = _thread_state.png_buffer = io.BytesIO()
+    buffer.seek(0)
+    return buffer
+
+
+@lru_cache(maxsize=None)
+def _torchvision_io():
+    """The torchvision.io module (native PNG codecs), or None if it is unusable."""
+    try:
+        import torchvision.io
+    except Exception:
+        # ImportError, or RuntimeError from a torch/torchvision version mismatch
+        return None
+    return torchvision.io
+
+
+# Placeholder outputs are shared between calls, like any cached node output
+# in ComfyUI, so consumers must not modify them in place
+@lru_cache(maxsize=None)
+def _placeholder_mask():
+    """Cached all-ones 64x64 MASK used when the input has no usable size."""
+    import torch
+
+    return torch.ones((1, 64, 64))
+
+
+@lru_cache(maxsize=None)
+def _placeholder_image():
+    """Cached black 64x64 IMAGE used when there is no input image."""
+    import torch
+
+    return torch.zeros((1, 64, 64, 3))
 
 
 class CanvasParser(BaseParser):
@@ -27,19 +104,15 @@ class CanvasParser(BaseParser):
     CANVAS_MARKER = "$WAS_CANVAS$"
     OUTPUT_MARKER = "$WAS_CANVAS_OUTPUT$"
     CANVAS_TYPE = "canvas_composer"
+    DATA_URL_PREFIX = "data:image/png;base64,"
+
+    # Plain strings and scalars are never IMAGE tensors
+    INPUT_IGNORE_TYPES = (str, int, float, bool)
 
     @classmethod
     def detect_input(cls, content) -> bool:
         """Check if content contains IMAGE tensors that should be displayed in canvas view."""
-        if content is None:
-            return False
-
-        items = content if isinstance(content, (list, tuple)) else [content]
-
-        for item in items:
-            if cls._is_image_tensor(item):
-                return True
-        return False
+        return cls._any_image_tensor(content)
 
     @classmethod
     def handle_input(cls, content, logger=None) -> dict:
@@ -69,7 +142,7 @@ class CanvasParser(BaseParser):
             "count": len(image_files),
         }
 
-        display_content = cls.CANVAS_MARKER + json.dumps(canvas_data)
+        display_content = cls.CANVAS_MARKER + _dumps(canvas_data)
         content_hash = f"canvas_{session_id}_{len(image_files)}"
 
         if logger:
@@ -83,31 +156,22 @@ class CanvasParser(BaseParser):
             "content_hash": content_hash,
         }
 
-    @classmethod
-    def detect_output(cls, content: str) -> bool:
-        """Check if content is canvas composite output (base64 image)."""
-        if not isinstance(content, str):
-            return False
-        return content.startswith(cls.OUTPUT_MARKER)
-
     @classmethod
     def parse_output(cls, content: str, logger=None) -> dict:
         """Parse canvas composite output and convert to IMAGE tensor."""
-        import torch
-        import numpy as np
-        from PIL import Image
-
         base64_data = content[len(cls.OUTPUT_MARKER) :]
 
         if base64_data.startswith("data:"):
             base64_data = base64_data.split(",", 1)[1]
 
         try:
-            image_bytes = base64.b64decode(base64_data)
-            pil_img = Image.open(io.BytesIO(image_bytes)).convert("RGBA")
+            image_bytes = b64decode(base64_data)
+            # Only keep an alpha channel the composite actually has
+            pixels = cls._decode_image(image_bytes, force_alpha=False)
+            height, width, channels = pixels.shape
+            mode = "RGBA" if channels == 4 else "RGB"
 
-            img_array = np.array(pil_img).astype(np.float32) / 255.0
-            img_tensor = torch.from_numpy(img_array).unsqueeze(0)
+            img_tensor = pixels.float().div_(255.0).unsqueeze(0)
 
             if logger:
                 logger.info(
@@ -116,8 +180,8 @@ class CanvasParser(BaseParser):
 
             return {
                 "output_values": [img_tensor],
-                "display_text": f"Canvas Output: {pil_img.width}x{pil_img.height} RGBA",
-                "content_hash": f"canvas_output_{pil_img.width}x{pil_img.height}_{hash(base64_data[:100]) & 0xFFFFFFFF}",
+                "display_text": f"Canvas Output: {width}x{height} {mode}",
+                "content_hash": f"canvas_output_{width}x{height}_{hash(base64_data[:100]) & 0xFFFFFFFF}",
             }
 
         except Exception as e:
@@ -125,87 +189,189 @@ class CanvasParser(BaseParser):
                 logger.error(f"[Canvas Parser] Failed to convert composite: {e}")
             return None
 
+    @staticmethod
+    def _decode_image(image_bytes, force_alpha=True):
+        """
+        Decode encoded image bytes to an [H,W,C] uint8 torch tensor.
+
+        C is 4 when force_alpha is set or the source has an alpha channel,
+        otherwise 3. torchvision decodes straight into a tensor; PIL handles
+        the formats it cannot, or everything when torchvision is unavailable.
+        """
+        import torch
+
+        tv_io = _torchvision_io()
+        if tv_io is not None:
+            modes = tv_io.ImageReadMode
+            try:
+                data = torch.frombuffer(bytearray(image_bytes), dtype=torch.uint8)
+                chw = tv_io.decode_image(
+                    data, mode=modes.RGB_ALPHA if force_alpha else modes.UNCHANGED
+                )
+            except RuntimeError:
+                pass
+            else:
+                if chw.shape[0] == 1:
+                    chw = chw.expand(3, -1, -1)
+                elif chw.shape[0] == 2:
+                    chw = chw[[0, 0, 0, 1]]
+                return chw.permute(1, 2, 0).contiguous()
+
+        import numpy as np
+        from PIL import Image
+
+        pil_img = Image.open(io.BytesIO(image_bytes))
+        has_alpha = "A" in pil_img.getbands() or "transparency" in pil_img.info
+        mode = "RGBA" if force_alpha or has_alpha else "RGB"
+        if pil_img.mode != mode:
+            pil_img = pil_img.convert(mode)
+        return torch.from_numpy(np.array(pil_img))
+
+    @classmethod
+    def _any_image_tensor(cls, content) -> bool:
+        """True if content (a single item or a list/tuple of items) holds an IMAGE tensor."""
+        if content is None:
+            return False
+        items = content if isinstance(content, (list, tuple)) else (content,)
+        return any(map(cls._is_image_tensor, items))
+
     @staticmethod
     def _is_image_tensor(item) -> bool:
         """Check if item is an IMAGE tensor (torch tensor with shape [B,H,W,C] or [H,W,C])."""
-        if item is None:
+        # ndim first: strings, dicts and None fail on a single getattr
+        if getattr(item, "ndim", None) not in _IMAGE_NDIMS:
             return False
-        if hasattr(item, "shape") and hasattr(item, "cpu"):
-            shape = item.shape
-            if len(shape) == 4 and shape[-1] in (1, 3, 4):
-                return True
-            if len(shape) == 3 and shape[-1] in (1, 3, 4):
-                return True
-        return False
+        return item.shape[-1] in _IMAGE_CHANNELS and hasattr(item, "cpu")
 
     @staticmethod
     def _tensor_to_input_files(tensor, session_id, logger=None):
         """Convert IMAGE tensor to input PNG files (persists across restarts)."""
-        import numpy as np
-        from PIL import Image
         import folder_paths
 
         input_dir = folder_paths.get_input_directory()
         subdir = f"was_viewer_{session_id}"
         full_subdir = os.path.join(input_dir, subdir)
         os.makedirs(full_subdir, exist_ok=True)
+        # One listing up front instead of an exists() stat per frame
+        existing = set(os.listdir(full_subdir))
 
         files = []
 
         if len(tensor.shape) == 3:
             tensor = tensor.unsqueeze(0)
 
-        batch_size = tensor.shape[0]
-
-        for idx in range(batch_size):
-            img_array = tensor[idx].cpu().numpy()
-            img_array = (img_array * 255).astype(np.uint8)
+        # One conversion for the whole batch, done on-device before the copy
+        # to host so only a quarter of the bytes cross as uint8
+        u8_batch = CanvasParser._to_uint8(tensor)
 
-            if img_array.shape[-1] == 4:
-                pil_img = Image.fromarray(img_array, mode="RGBA")
-                pil_img = CanvasParser._trim_transparency(pil_img)
-            elif img_array.shape[-1] == 3:
-                pil_img = Image.fromarray(img_array, mode="RGB")
-            else:
-                pil_img = Image.fromarray(img_array)
-
-            img_hash = hashlib.md5(img_array.tobytes()).hexdigest()[:12]
+        pending = []
+        for idx, img_array in enumerate(u8_batch):
+            # Name the file from the raw pixels first so an existing file
+            # skips building, trimming and encoding the image entirely
+            img_hash = _image_digest(memoryview(img_array))
             filename = f"{idx:04d}_{img_hash}.png"
-            filepath = os.path.join(full_subdir, filename)
+            files.append({"filename": filename, "subfolder": subdir, "type": "input"})
 
-            if not os.path.exists(filepath):
-                pil_img.save(filepath, format="PNG")
-                if logger:
-                    logger.debug(f"[Canvas Parser] Saved: {filepath}")
+            if filename not in existing:
+                pending.append((img_array, os.path.join(full_subdir, filename)))
 
-            files.append({"filename": filename, "subfolder": subdir, "type": "input"})
+        # PNG compression and the file write release the GIL, so frames encode
+        # in parallel; results are not needed, only completion
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as pool:
+                list(pool.map(lambda job: CanvasParser._save_frame(*job), pending))
+        else:
+            for img_array, filepath in pending:
+                CanvasParser._save_frame(img_array, filepath)
+
+        if logger:
+            for _, filepath in pending:
+                logger.debug(f"[Canvas Parser] Saved: {filepath}")
 
         return files
 
     @staticmethod
-    def _trim_transparency(pil_img, padding=0):
-        """Trim transparent pixels from image edges."""
+    def _save_frame(img_array, filepath):
+        """Write one HWC uint8 frame as PNG, trimming transparent edges of RGBA."""
+        from PIL import Image
+
+        if img_array.shape[-1] == 4:
+            img_array = CanvasParser._trim_transparency(img_array)
+            pil_img = Image.fromarray(img_array, mode="RGBA")
+        elif img_array.shape[-1] == 3:
+            pil_img = Image.fromarray(img_array, mode="RGB")
+        else:
+            pil_img = Image.fromarray(img_array)
+
+        pil_img.save(filepath, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+
+    @staticmethod
+    def _to_uint8(images):
+        """
+        Convert float [0, 1] image data to a uint8 ndarray in one vectorized op.
+
+        Works on a whole [B,H,W,C] batch or a single [H,W,C] frame, on any
+        device. Values are truncated like astype(np.uint8), after clamping.
+        """
         import numpy as np
 
-        if pil_img.mode != "RGBA":
-            return pil_img
+        if hasattr(images, "cpu"):
+            u8 = images.detach().mul(255).clamp_(0, 255).byte()
+            return u8.contiguous().cpu().numpy()
+        return np.clip(np.asarray(images) * 255, 0, 255).astype(np.uint8)
 
-        alpha = np.array(pil_img.split()[-1])
-        rows = np.any(alpha > 0, axis=1)
-        cols = np.any(alpha > 0, axis=0)
+    @staticmethod
+    def _encode_png_base64(img_array) -> str:
+        """Encode an HWC uint8 array as PNG and return it base64-encoded."""
+        tv_io = _torchvision_io()
+        # torchvision encodes grayscale and RGB; RGBA goes through PIL
+        if tv_io is not None and img_array.shape[-1] in (1, 3):
+            import torch
 
-        if not rows.any() or not cols.any():
-            return pil_img
+            chw = torch.from_numpy(img_array).permute(2, 0, 1).contiguous()
+            png = tv_io.encode_png(chw, compression_level=PNG_COMPRESS_LEVEL)
+            return b64encode(png.numpy()).decode("ascii")
 
-        rmin, rmax = np.where(rows)[0][[0, -1]]
-        cmin, cmax = np.where(cols)[0][[0, -1]]
+        from PIL import Image
 
-        rmin = max(0, rmin - padding)
-        rmax = min(pil_img.height - 1, rmax + padding)
-        cmin = max(0, cmin - padding)
-        cmax = min(pil_img.width - 1, cmax + padding)
+        if img_array.shape[-1] == 1:
+            img_array = img_array[..., 0]
+        buffer = _png_buffer()
+        Image.fromarray(img_array).save(
+            buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL
+        )
+        # Read only what this frame wrote; views are released before reuse
+        size = buffer.tell()
+        with buffer.getbuffer() as view, view[:size] as png:
+            return b64encode(png).decode("ascii")
 
-        return pil_img.crop((cmin, rmin, cmax + 1, rmax + 1))
+    @staticmethod
+    def _trim_transparency(img_array, padding=0):
+        """Trim transparent pixels from the edges of an HWC RGBA uint8 array."""
+        if img_array.ndim != 3 or img_array.shape[-1] != 4:
+            return img_array
+
+        # any() on uint8 alpha tests alpha > 0 without building a bool mask
+        alpha = img_array[..., 3]
+        rows = alpha.any(axis=1)
+        if not rows.any():
+            return img_array
+
+        # argmax stops at the first True, unlike where() which builds index arrays
+        height, width = alpha.shape
+        top = int(rows.argmax())
+        bottom = height - 1 - int(rows[::-1].argmax())
+        # Columns only need scanning within the opaque row band
+        cols = alpha[top : bottom + 1].any(axis=0)
+        left = int(cols.argmax())
+        right = width - 1 - int(cols[::-1].argmax())
+
+        rmin = max(0, top - padding)
+        rmax = min(height - 1, bottom + padding)
+        cmin = max(0, left - padding)
+        cmax = min(width - 1, right + padding)
+
+        return img_array[rmin : rmax + 1, cmin : cmax + 1]
 
     @classmethod
     def detect_state(cls, state_data: dict) -> bool:
@@ -222,10 +388,6 @@ class CanvasParser(BaseParser):
                            display_content (JSON for UI)
             or None if invalid
         """
-        import torch
-        import numpy as np
-        from PIL import Image
-
         if not isinstance(state_data, dict) or "dataUrl" not in state_data:
             return None
 
@@ -236,27 +398,19 @@ class CanvasParser(BaseParser):
             else:
                 b64_data = data_url
 
-            img_bytes = base64.b64decode(b64_data)
-            pil_img = Image.open(io.BytesIO(img_bytes))
-
-            if pil_img.mode == "RGBA":
-                alpha_channel = pil_img.split()[3]
-                alpha_array = np.array(alpha_channel).astype(np.float32) / 255.0
-                alpha_mask = torch.from_numpy(alpha_array).unsqueeze(0)
-                rgb_img = Image.new("RGB", pil_img.size, (0, 0, 0))
-                rgb_img.paste(pil_img, mask=alpha_channel)
-                pil_img = rgb_img
-            else:
-                alpha_mask = torch.ones((1, pil_img.height, pil_img.width))
-                if pil_img.mode != "RGB":
-                    pil_img = pil_img.convert("RGB")
+            img_bytes = b64decode(b64_data)
+            rgba = cls._decode_image(img_bytes).float().div_(255.0)
+            height, width = rgba.shape[0], rgba.shape[1]
 
-            img_array = np.array(pil_img).astype(np.float32) / 255.0
-            composed_image = torch.from_numpy(img_array).unsqueeze(0)
+            # Compositing onto black is just rgb * alpha; images without an
+            # alpha channel decode with alpha 1.0, giving an all-ones mask
+            alpha = rgba[..., 3:]
+            composed_image = (rgba[..., :3] * alpha).unsqueeze(0)
+            alpha_mask = alpha.squeeze(-1).unsqueeze(0).contiguous()
 
             if logger:
                 logger.info(
-                    f"[Canvas Parser] Loaded composed image from state: {pil_img.width}x{pil_img.height}"
+                    f"[Canvas Parser] Loaded composed image from state: {width}x{height}"
                 )
 
             canvas_data = {
@@ -269,9 +423,9 @@ class CanvasParser(BaseParser):
             return {
                 "image": composed_image,
                 "mask": alpha_mask,
-                "width": pil_img.width,
-                "height": pil_img.height,
-                "display_content": json.dumps(canvas_data),
+                "width": width,
+                "height": height,
+                "display_content": _dumps(canvas_data),
                 "content_hash": "composed",
             }
 
@@ -283,13 +437,7 @@ class CanvasParser(BaseParser):
     @classmethod
     def detect_display_content(cls, content) -> bool:
         """Check if content contains IMAGE tensors for display."""
-        if content is None:
-            return False
-        items = content if isinstance(content, (list, tuple)) else [content]
-        for item in items:
-            if cls._is_image_tensor(item):
-                return True
-        return False
+        return cls._any_image_tensor(content)
 
     @classmethod
     def prepare_display(cls, content, logger=None) -> dict:
@@ -299,45 +447,24 @@ class CanvasParser(BaseParser):
         Returns:
             dict with keys: display_content (JSON string), count, content_hash
         """
-        import numpy as np
-        from PIL import Image
-
         images = content if isinstance(content, (list, tuple)) else [content]
         base64_images = []
 
         try:
             for img_batch in images:
-                if img_batch is None:
+                if img_batch is None or not hasattr(img_batch, "shape"):
                     continue
 
-                if hasattr(img_batch, "shape"):
-                    if len(img_batch.shape) == 4:
-                        for i in range(img_batch.shape[0]):
-                            img_array = (
-                                img_batch[i].cpu().numpy()
-                                if hasattr(img_batch[i], "cpu")
-                                else img_batch[i]
-                            )
-                            img_array = (img_array * 255).astype(np.uint8)
-                            pil_img = Image.fromarray(img_array)
-
-                            buffer = io.BytesIO()
-                            pil_img.save(buffer, format="PNG")
-                            b64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
-                            base64_images.append(f"data:image/png;base64,{b64}")
-                    elif len(img_batch.shape) == 3:
-                        img_array = (
-                            img_batch.cpu().numpy()
-                            if hasattr(img_batch, "cpu")
-                            else img_batch
-                        )
-                        img_array = (img_array * 255).astype(np.uint8)
-                        pil_img = Image.fromarray(img_array)
-
-                        buffer = io.BytesIO()
-                        pil_img.save(buffer, format="PNG")
-                        b64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
-                        base64_images.append(f"data:image/png;base64,{b64}")
+                if len(img_batch.shape) == 4:
+                    frames = cls._to_uint8(img_batch)
+                elif len(img_batch.shape) == 3:
+                    frames = (cls._to_uint8(img_batch),)
+                else:
+                    continue
+
+                for img_array in frames:
+                    b64 = cls._encode_png_base64(img_array)
+                    base64_images.append(cls.DATA_URL_PREFIX + b64)
         except Exception as e:
             if logger:
                 logger.error(f"[Canvas Parser] Error converting images: {e}")
@@ -352,7 +479,7 @@ class CanvasParser(BaseParser):
             logger.info(f"[Canvas Parser] Processed {len(base64_images)} images")
 
         return {
-            "display_content": json.dumps(canvas_data),
+            "display_content": _dumps(canvas_data),
             "count": len(base64_images),
             "content_hash": str(len(base64_images)),
         }
@@ -365,8 +492,6 @@ class CanvasParser(BaseParser):
         Returns:
             tuple matching output_types, or None if not applicable
         """
-        import torch
-
         if not output_types or set(output_types) != {"IMAGE", "MASK"}:
             return None
 
@@ -375,13 +500,15 @@ class CanvasParser(BaseParser):
         if images and len(images) > 0 and images[0] is not None:
             output_image = images[0]
             if hasattr(images[0], "shape") and len(images[0].shape) >= 3:
+                import torch
+
                 h, w = images[0].shape[1], images[0].shape[2]
                 output_mask = torch.ones((1, h, w))
             else:
-                output_mask = torch.ones((1, 64, 64))
+                output_mask = _placeholder_mask()
         else:
-            output_image = torch.zeros((1, 64, 64, 3))
-            output_mask = torch.ones((1, 64, 64))
+            output_image = _placeholder_image()
+            output_mask = _placeholder_mask()
 
         if output_types[0] == "IMAGE":
             return (output_image, output_mask)
@@ -0,0 +1,84 @@
+"""
+Shared JSON helpers for WAS Content Viewer.
+
+dumps() uses orjson when it is installed and stdlib json otherwise, with the
+same options on both paths: compact separators, non-ASCII kept as UTF-8,
+NaN/Infinity written as null, non-str dict keys stringified, and arrays or
+tensors encoded as lists. Only float notation can differ (e.g. 1e-05 vs
+0.00001); both decode to the same value.
+"""
+
+import json
+import math
+
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+except ImportError:
+    orjson = None
+
+
+def _default(value):
+    """Encode arrays/tensors as lists and any other unsupported value as str()."""
+    if hasattr(value, "tolist"):
+        try:
+            return value.tolist()
+        except Exception:
+            pass
+    return str(value)
+
+
+def _finite(obj):
+    """Copy of obj with non-finite floats replaced by None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if obj is None or isinstance(obj, (str, int)):
+        return obj
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return _finite(_default(obj))
+
+
+def _json_dumps(obj) -> str:
+    """Stdlib json path of dumps()."""
+    try:
+        return json.dumps(
+            obj,
+            default=_default,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            allow_nan=False,
+        )
+    except ValueError:
+        # allow_nan=False raises on NaN/Infinity; write those as null instead
+        return json.dumps(
+            _finite(obj), default=_default, separators=(",", ":"), ensure_ascii=False
+        )
+
+
+if orjson is not None:
+
+    def dumps(obj) -> str:
+        """Serialize obj to a compact JSON string."""
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS).decode(
+                "utf-8"
+            )
+        except TypeError:
+            # orjson rejects some values stdlib json accepts (e.g. >64-bit ints)
+            return _json_dumps(obj)
+
+    # Accepts str and bytes directly
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+else:
+    dumps = _json_dumps
+    loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
@@ -10,12 +10,34 @@ Handles unrecognized Python objects including:
 Generates metrics, spectral data for image types, and trimmed serializations.
 """
 
-import json
+import hashlib
 import inspect
+import math
 import sys
-from typing import Dict, Optional
+import weakref
+from typing import Dict, Optional, Tuple, Union
 
 from .base_parser import BaseParser
+from .json_utils import dumps as _dumps
+
+# The fallback content hash only keys the view cache, so a fast
+# non-cryptographic hash of a small fingerprint is enough
+try:
+    import xxhash
+
+    def _hash32(data: bytes) -> int:
+        return xxhash.xxh3_64_intdigest(data) & 0xFFFFFFFF
+
+except ImportError:
+
+    def _hash32(data: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(data, digest_size=4).digest(), "little")
+
+
+# Type-only categorization traits and class source info, keyed by type. Weak
+# keys let dynamically created classes be freed
+_TYPE_TRAITS_CACHE = weakref.WeakKeyDictionary()
+_SOURCE_INFO_CACHE = weakref.WeakKeyDictionary()
 
 
 class ObjectParser(BaseParser):
@@ -25,6 +47,9 @@ class ObjectParser(BaseParser):
     PARSER_PRIORITY = 5  # Low priority - fallback for unrecognized objects
     OUTPUT_MARKER = "$WAS_OBJECT$"
 
+    # Basic types are left to the text view (see _is_introspectable)
+    INPUT_IGNORE_TYPES = (str, int, float, bool)
+
     # Size limits for serialization
     MAX_TENSOR_ELEMENTS_PREVIEW = 100
     MAX_STRING_LENGTH = 500
@@ -32,6 +57,10 @@ class ObjectParser(BaseParser):
     MAX_DICT_KEYS = 100
     MAX_ATTR_VALUE_LENGTH = 200
 
+    # Preview statistics and histograms use a strided sample of at most this
+    # many elements; min/max are still taken over the full data
+    MAX_STATS_ELEMENTS = 1_000_000
+
     @classmethod
     def detect_input(cls, content) -> bool:
         """Detect any non-None object that isn't handled by other parsers."""
@@ -62,7 +91,7 @@ class ObjectParser(BaseParser):
         return True
 
     @classmethod
-    def handle_input(cls, content, logger=None) -> dict:
+    def handle_input(cls, content, logger=None, fingerprint=None) -> dict:
         """Process objects and generate metrics/serialization for display."""
         items = content if isinstance(content, (list, tuple)) else [content]
 
@@ -86,8 +115,10 @@ class ObjectParser(BaseParser):
         if object_data["count"] == 0:
             return None
 
-        display_content = cls.OUTPUT_MARKER + json.dumps(object_data, default=str)
-        content_hash = f"object_{len(object_data['objects'])}_{hash(str(content)[:100]) & 0xFFFFFFFF}"
+        display_content = cls.OUTPUT_MARKER + _dumps(object_data)
+        if fingerprint is None:
+            fingerprint = cls._content_fingerprint(items)
+        content_hash = f"object_{len(object_data['objects'])}_{fingerprint}"
 
         if logger:
             logger.info(f"[Object Parser] Processed {object_data['count']} objects")
@@ -98,6 +129,43 @@ class ObjectParser(BaseParser):
             "content_hash": content_hash,
         }
 
+    @classmethod
+    def _content_fingerprint(cls, items) -> int:
+        """
+        Hash a bounded description of each item instead of str(content), which
+        would render whole tensors and arrays just to keep the first 100 chars.
+        """
+        parts = []
+        for item in items:
+            if item is None or isinstance(item, (str, int, float, bool)):
+                parts.append(repr(item)[:100])
+            elif hasattr(item, "shape") and hasattr(item, "dtype"):
+                parts.append(
+                    (
+                        type(item).__name__,
+                        tuple(item.shape),
+                        str(item.dtype),
+                        cls._leading_values(item),
+                    )
+                )
+            elif isinstance(item, dict):
+                parts.append(("dict", len(item), [str(k) for k in list(item)[:16]]))
+            elif isinstance(item, (list, tuple)):
+                parts.append((type(item).__name__, len(item)))
+            else:
+                parts.append((type(item).__name__, id(item)))
+        return _hash32(repr(parts).encode("utf-8", errors="replace"))
+
+    @staticmethod
+    def _leading_values(arr, count: int = 16):
+        """Leading values of the first row, reached through views (no full copy)."""
+        try:
+            while arr.ndim > 1:
+                arr = arr[0]
+            return arr[:count].tolist() if arr.ndim else arr.tolist()
+        except Exception:
+            return None
+
     @classmethod
     def _introspect_object(cls, obj, logger=None) -> Optional[Dict]:
         """Generate full introspection data for an object."""
@@ -148,8 +216,9 @@ class ObjectParser(BaseParser):
 
         else:
             # Generic object
-            result["attributes"] = cls._get_object_attributes(obj)
-            result["metrics"] = cls._get_object_metrics(obj)
+            attrs, attr_count, method_count = cls._classify_attrs(obj)
+            result["attributes"] = attrs
+            result["metrics"] = cls._get_object_metrics(obj, attr_count, method_count)
             result["source_info"] = cls._get_source_info(obj)
             result["serialized"] = cls._serialize_object(obj)
 
@@ -157,36 +226,80 @@ class ObjectParser(BaseParser):
 
     @classmethod
     def _categorize_object(cls, obj) -> str:
-        """Determine the category of an object."""
-        obj_type = type(obj).__name__
-        module = type(obj).__module__
+        """
+        Determine the category of an object.
+
+        Module/name checks come from a per-type cache; the hasattr checks run
+        on every call, since instances of one class (proxies, __getattr__
+        wrappers, lazy handles) can expose different attributes.
+        """
+        obj_cls = type(obj)
+
+        # Plain builtin collections can't match any check below
+        if obj_cls is dict:
+            return "dict"
+        if obj_cls is list or obj_cls is tuple:
+            return "list"
+
+        array_category, type_category = cls._type_traits(obj_cls)
 
         # Check for tensor types
-        if hasattr(obj, "shape") and hasattr(obj, "dtype"):
-            if "torch" in module:
-                return "tensor"
-            if "numpy" in module or obj_type == "ndarray":
-                return "numpy"
+        if array_category and hasattr(obj, "shape") and hasattr(obj, "dtype"):
+            return array_category
 
-        # Check for PIL Image
-        if "PIL" in module or obj_type == "Image":
-            return "pil_image"
-
-        # Check for safetensors
-        if (
-            "safetensors" in module
-            or hasattr(obj, "keys")
-            and hasattr(obj, "get_tensor")
-        ):
+        # PIL Image, or a class from the safetensors module
+        if type_category in ("pil_image", "safetensors"):
+            return type_category
+
+        # Check for safetensors-like handles
+        if hasattr(obj, "keys") and hasattr(obj, "get_tensor"):
             return "safetensors"
 
-        # Basic collections
-        if isinstance(obj, dict):
-            return "dict"
-        if isinstance(obj, (list, tuple)):
-            return "list"
+        return type_category
+
+    @staticmethod
+    def _type_traits(obj_cls) -> Tuple[Optional[str], str]:
+        """
+        Categorization facts that depend only on the type, cached per type.
+
+        Returns (array_category, type_category): the category for instances
+        that also have shape/dtype ("tensor", "numpy" or None), and the
+        category implied by module, name and base class alone.
+        """
+        try:
+            cached = _TYPE_TRAITS_CACHE.get(obj_cls)
+        except TypeError:
+            cached = None
+        if cached is not None:
+            return cached
+
+        obj_type = obj_cls.__name__
+        module = obj_cls.__module__
+
+        if "torch" in module:
+            array_category = "tensor"
+        elif "numpy" in module or obj_type == "ndarray":
+            array_category = "numpy"
+        else:
+            array_category = None
 
-        return "object"
+        if "PIL" in module or obj_type == "Image":
+            type_category = "pil_image"
+        elif "safetensors" in module:
+            type_category = "safetensors"
+        elif issubclass(obj_cls, dict):
+            type_category = "dict"
+        elif issubclass(obj_cls, (list, tuple)):
+            type_category = "list"
+        else:
+            type_category = "object"
+
+        traits = (array_category, type_category)
+        try:
+            _TYPE_TRAITS_CACHE[obj_cls] = traits
+        except TypeError:
+            pass
+        return traits
 
     # ========== TENSOR METHODS ==========
 
@@ -209,17 +322,15 @@ class ObjectParser(BaseParser):
             metrics["memory_bytes"] = tensor.element_size() * tensor.numel()
             metrics["memory_human"] = cls._format_bytes(metrics["memory_bytes"])
 
-            # Statistical metrics (on CPU for safety)
+            # Statistical metrics, reduced on the tensor's device
             try:
-                t = tensor.detach().float()
-                if t.device.type != "cpu":
-                    t = t.cpu()
-
+                t = tensor.detach()
+                sample = t.reshape(-1)[:: cls._stats_step(t.numel())].float()
                 metrics["stats"] = {
                     "min": float(t.min()),
                     "max": float(t.max()),
-                    "mean": float(t.mean()),
-                    "std": float(t.std()),
+                    "mean": float(sample.mean()),
+                    "std": float(sample.std()),
                 }
 
                 # Check for image-like tensor
@@ -243,11 +354,9 @@ class ObjectParser(BaseParser):
     def _get_tensor_spectral(cls, tensor) -> Optional[Dict]:
         """Generate spectral/histogram data for tensor."""
         try:
-            import torch
-
-            t = tensor.detach().float()
-            if t.device.type != "cpu":
-                t = t.cpu()
+            # Sampling happens on the tensor's device; Tensor.histogram is CPU-only,
+            # so only the sample is transferred
+            t = tensor.detach()
 
             # Check if it looks like an image tensor
             shape = tensor.shape
@@ -270,14 +379,18 @@ class ObjectParser(BaseParser):
 
             if not is_image:
                 # Generate simple histogram for non-image tensor
-                flat = t.flatten()
-                hist, bin_edges = torch.histogram(flat, bins=64)
+                flat = t.reshape(-1)[:: cls._stats_step(t.numel())].cpu().float()
+                hist, bin_edges = flat.histogram(bins=64)
                 return {
                     "type": "histogram",
-                    "data": hist.tolist(),
-                    "bins": bin_edges.tolist(),
+                    "data": hist.numpy(),
+                    "bins": bin_edges.numpy(),
                 }
 
+            # Subsample pixels evenly along both spatial axes
+            step = cls._stats_step(t[..., 0].numel(), dims=2)
+            t = t[..., ::step, ::step, :].cpu().float()
+
             # Generate channel histograms for image
             spectral = {
                 "type": "spectral",
@@ -290,14 +403,17 @@ class ObjectParser(BaseParser):
                 else [f"C{i}" for i in range(channels)]
             )
 
+            # Channel views are histogrammed in place; the edges are shared
+            bins = None
             for i in range(channels):
-                channel = t[..., i].flatten()
-                hist, bin_edges = torch.histogram(channel, bins=64, range=(0.0, 1.0))
+                hist, bin_edges = t[..., i].histogram(bins=64, range=(0.0, 1.0))
+                if bins is None:
+                    bins = bin_edges.numpy()
                 spectral["channels"].append(
                     {
                         "name": channel_names[i],
-                        "histogram": hist.tolist(),
-                        "bins": bin_edges.tolist(),
+                        "histogram": hist.numpy(),
+                        "bins": bins,
                     }
                 )
 
@@ -306,15 +422,12 @@ class ObjectParser(BaseParser):
             return None
 
     @classmethod
-    def _serialize_tensor(cls, tensor) -> str:
+    def _serialize_tensor(cls, tensor) -> Dict:
         """Create trimmed serialization of tensor."""
         try:
-            t = tensor.detach()
-            if t.device.type != "cpu":
-                t = t.cpu()
-
-            flat = t.flatten()
-            total = len(flat)
+            # tolist() copies just the previewed elements off the device
+            flat = tensor.detach().reshape(-1)
+            total = flat.numel()
 
             if total <= cls.MAX_TENSOR_ELEMENTS_PREVIEW:
                 data = flat.tolist()
@@ -327,15 +440,13 @@ class ObjectParser(BaseParser):
                 data = first + ["..."] + last
                 truncated = True
 
-            return json.dumps(
-                {
-                    "preview": data,
-                    "truncated": truncated,
-                    "total_elements": total,
-                }
-            )
+            return {
+                "preview": data,
+                "truncated": truncated,
+                "total_elements": total,
+            }
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return {"error": str(e)}
 
     # ========== PIL IMAGE METHODS ==========
 
@@ -372,11 +483,12 @@ class ObjectParser(BaseParser):
                 import numpy as np
 
                 arr = np.array(img)
+                sample = arr.ravel()[:: cls._stats_step(arr.size)]
                 metrics["stats"] = {
                     "min": int(arr.min()),
                     "max": int(arr.max()),
-                    "mean": float(arr.mean()),
-                    "std": float(arr.std()),
+                    "mean": float(sample.mean()),
+                    "std": float(sample.std()),
                 }
             except Exception:
                 pass
@@ -394,6 +506,9 @@ class ObjectParser(BaseParser):
             arr = np.array(img)
             channels = arr.shape[-1] if len(arr.shape) == 3 else 1
 
+            step = cls._stats_step(arr.shape[0] * arr.shape[1], dims=2)
+            arr = arr[::step, ::step]
+
             spectral = {
                 "type": "spectral",
                 "channels": [],
@@ -403,32 +518,30 @@ class ObjectParser(BaseParser):
 
             if len(arr.shape) == 2:
                 # Grayscale
-                hist, bin_edges = np.histogram(arr.flatten(), bins=64, range=(0, 255))
+                names = ["L"]
+            else:
+                names = [
+                    bands[i] if i < len(bands) else f"C{i}"
+                    for i in range(min(channels, 4))
+                ]
+
+            hists, bin_edges = cls._channel_histograms(arr, len(names), (0, 255))
+            bins = bin_edges
+            for name, hist in zip(names, hists):
                 spectral["channels"].append(
                     {
-                        "name": "L",
-                        "histogram": hist.tolist(),
-                        "bins": bin_edges.tolist(),
+                        "name": name,
+                        "histogram": hist,
+                        "bins": bins,
                     }
                 )
-            else:
-                for i in range(min(channels, 4)):
-                    channel = arr[..., i].flatten()
-                    hist, bin_edges = np.histogram(channel, bins=64, range=(0, 255))
-                    spectral["channels"].append(
-                        {
-                            "name": bands[i] if i < len(bands) else f"C{i}",
-                            "histogram": hist.tolist(),
-                            "bins": bin_edges.tolist(),
-                        }
-                    )
 
             return spectral
         except Exception:
             return None
 
     @classmethod
-    def _serialize_pil(cls, img) -> str:
+    def _serialize_pil(cls, img) -> Dict:
         """Create trimmed serialization of PIL Image."""
         try:
             info = {
@@ -437,9 +550,9 @@ class ObjectParser(BaseParser):
                 "size": img.size,
                 "info_keys": list(img.info.keys()) if hasattr(img, "info") else [],
             }
-            return json.dumps(info)
+            return info
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return {"error": str(e)}
 
     # ========== NUMPY METHODS ==========
 
@@ -456,16 +569,17 @@ class ObjectParser(BaseParser):
                 "itemsize": int(arr.itemsize),
                 "memory_bytes": int(arr.nbytes),
                 "memory_human": cls._format_bytes(arr.nbytes),
-                "is_contiguous": bool(arr.flags["C_CONTIGUOUS"]),
+                "is_contiguous": arr.flags.c_contiguous,
             }
 
             # Statistics
             try:
+                sample = arr.ravel()[:: cls._stats_step(arr.size)]
                 metrics["stats"] = {
                     "min": float(arr.min()),
                     "max": float(arr.max()),
-                    "mean": float(arr.mean()),
-                    "std": float(arr.std()),
+                    "mean": float(sample.mean()),
+                    "std": float(sample.std()),
                 }
             except Exception:
                 pass
@@ -497,12 +611,12 @@ class ObjectParser(BaseParser):
                     is_image = True
 
             if not is_image:
-                flat = arr.flatten()
+                flat = arr.ravel()[:: cls._stats_step(arr.size)]
                 hist, bin_edges = np.histogram(flat, bins=64)
                 return {
                     "type": "histogram",
-                    "data": hist.tolist(),
-                    "bins": bin_edges.tolist(),
+                    "data": hist,
+                    "bins": bin_edges,
                 }
 
             spectral = {
@@ -518,38 +632,63 @@ class ObjectParser(BaseParser):
             else:
                 range_val = (float(arr.min()), float(arr.max()))
 
+            step = cls._stats_step(arr.shape[0] * arr.shape[1], dims=2)
+            arr = arr[::step, ::step]
+
             channel_names = ["R", "G", "B", "A"]
 
             if len(arr.shape) == 2:
-                hist, bin_edges = np.histogram(arr.flatten(), bins=64, range=range_val)
+                names = ["L"]
+            else:
+                names = channel_names[: min(arr.shape[-1], 4)]
+
+            hists, bin_edges = cls._channel_histograms(arr, len(names), range_val)
+            bins = bin_edges
+            for name, hist in zip(names, hists):
                 spectral["channels"].append(
                     {
-                        "name": "L",
-                        "histogram": hist.tolist(),
-                        "bins": bin_edges.tolist(),
+                        "name": name,
+                        "histogram": hist,
+                        "bins": bins,
                     }
                 )
-            else:
-                channels = arr.shape[-1]
-                for i in range(min(channels, 4)):
-                    channel = arr[..., i].flatten()
-                    hist, bin_edges = np.histogram(channel, bins=64, range=range_val)
-                    spectral["channels"].append(
-                        {
-                            "name": (
-                                channel_names[i] if i < len(channel_names) else f"C{i}"
-                            ),
-                            "histogram": hist.tolist(),
-                            "bins": bin_edges.tolist(),
-                        }
-                    )
 
             return spectral
         except Exception:
             return None
 
     @classmethod
-    def _serialize_numpy(cls, arr) -> str:
+    def _channel_histograms(cls, arr, channels: int, range_val: tuple):
+        """
+        Compute 64-bin histograms for the first `channels` channels of an
+        HW or HWC array, matching np.histogram(..., range=range_val).
+
+        Returns (counts of shape (channels, 64), bin_edges).
+        """
+        import numpy as np
+
+        flat = arr.reshape(-1, arr.shape[-1] if arr.ndim == 3 else 1)[:, :channels]
+
+        if flat.dtype != np.uint8:
+            results = [
+                np.histogram(flat[:, i], bins=64, range=range_val)
+                for i in range(channels)
+            ]
+            return np.stack([hist for hist, _ in results]), results[0][1]
+
+        # One bincount over all channels (offset by 256 per channel), then fold
+        # the 256 per-value counts into the 64 bins through a lookup table
+        bin_edges = np.histogram_bin_edges(flat[:0], bins=64, range=range_val)
+        lut = np.searchsorted(bin_edges, np.arange(256), side="right") - 1
+        np.minimum(lut, 63, out=lut)
+        offsets = np.arange(channels, dtype=np.intp) * 256
+        counts = np.bincount((flat + offsets).ravel(), minlength=channels * 256)
+        hists = np.zeros((channels, 64), dtype=np.int64)
+        np.add.at(hists, (slice(None), lut), counts.reshape(channels, 256))
+        return hists, bin_edges
+
+    @classmethod
+    def _serialize_numpy(cls, arr) -> Dict:
         """Create trimmed serialization of NumPy array."""
         try:
 
@@ -566,15 +705,13 @@ class ObjectParser(BaseParser):
                 data = first + ["..."] + last
                 truncated = True
 
-            return json.dumps(
-                {
-                    "preview": data,
-                    "truncated": truncated,
-                    "total_elements": total,
-                }
-            )
+            return {
+                "preview": data,
+                "truncated": truncated,
+                "total_elements": total,
+            }
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return {"error": str(e)}
 
     # ========== SAFETENSORS METHODS ==========
 
@@ -593,19 +730,17 @@ class ObjectParser(BaseParser):
             if hasattr(obj, "keys"):
                 keys = list(obj.keys())
                 metrics["tensor_count"] = len(keys)
+                get = getattr(obj, "get_tensor", None)
+                if get is None:
+                    get = getattr(obj, "__getitem__", None)
 
                 for key in keys[:50]:  # Limit to first 50 for display
                     try:
-                        if hasattr(obj, "get_tensor"):
-                            tensor = obj.get_tensor(key)
-                        else:
-                            tensor = obj[key]
+                        tensor = get(key)
 
                         if hasattr(tensor, "shape"):
                             shape = list(tensor.shape)
-                            numel = 1
-                            for s in shape:
-                                numel *= s
+                            numel = math.prod(shape)
                             metrics["total_parameters"] += numel
 
                             dtype = (
@@ -646,21 +781,19 @@ class ObjectParser(BaseParser):
             return {"error": str(e)}
 
     @classmethod
-    def _serialize_safetensors(cls, obj) -> str:
+    def _serialize_safetensors(cls, obj) -> Dict:
         """Create trimmed serialization of SafeTensors."""
         try:
             if hasattr(obj, "keys"):
                 keys = list(obj.keys())
-                return json.dumps(
-                    {
-                        "tensor_names": keys[:100],
-                        "truncated": len(keys) > 100,
-                        "total_tensors": len(keys),
-                    }
-                )
-            return json.dumps({"type": "safetensors", "readable": False})
+                return {
+                    "tensor_names": keys[:100],
+                    "truncated": len(keys) > 100,
+                    "total_tensors": len(keys),
+                }
+            return {"type": "safetensors", "readable": False}
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return {"error": str(e)}
 
     # ========== DICT/LIST METHODS ==========
 
@@ -675,7 +808,7 @@ class ObjectParser(BaseParser):
         }
 
     @classmethod
-    def _serialize_dict(cls, obj: dict) -> str:
+    def _serialize_dict(cls, obj: dict) -> Dict:
         """Create trimmed serialization of dict."""
         try:
             trimmed = {}
@@ -686,9 +819,9 @@ class ObjectParser(BaseParser):
                     )
                     break
                 trimmed[str(k)] = cls._serialize_value(v)
-            return json.dumps(trimmed, default=str, indent=2)
+            return trimmed
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return {"error": str(e)}
 
     @classmethod
     def _get_list_metrics(cls, obj) -> Dict:
@@ -701,7 +834,7 @@ class ObjectParser(BaseParser):
         }
 
     @classmethod
-    def _serialize_list(cls, obj) -> str:
+    def _serialize_list(cls, obj) -> Union[list, Dict]:
         """Create trimmed serialization of list."""
         try:
             if len(obj) <= cls.MAX_LIST_ITEMS:
@@ -711,45 +844,58 @@ class ObjectParser(BaseParser):
                 items = [cls._serialize_value(v) for v in obj[:half]]
                 items.append(f"... ({len(obj) - cls.MAX_LIST_ITEMS} more items) ...")
                 items.extend([cls._serialize_value(v) for v in obj[-half:]])
-            return json.dumps(items, default=str, indent=2)
+            return items
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return {"error": str(e)}
 
     # ========== GENERIC OBJECT METHODS ==========
 
     @classmethod
-    def _get_object_attributes(cls, obj) -> Dict:
-        """Get attributes of a generic object."""
+    def _classify_attrs(cls, obj) -> Tuple[Dict, int, int]:
+        """
+        Split a generic object's attributes from its methods in one dir() pass.
+
+        Returns (attributes, attribute_count, method_count). Only the first
+        MAX_DICT_KEYS attributes are serialized; the counts cover everything.
+        """
         attrs = {}
+        attr_count = 0
+        method_count = 0
 
         try:
-            # Get all attributes
-            for name in dir(obj):
-                if name.startswith("__"):
-                    continue
-                try:
-                    value = getattr(obj, name)
-                    if callable(value):
-                        continue  # Skip methods
+            names = dir(obj)
+        except Exception:
+            return attrs, 0, 0
 
+        for name in names:
+            if name.startswith("__"):
+                continue
+            try:
+                value = getattr(obj, name)
+            except Exception:
+                attr_count += 1
+                continue
+
+            if callable(value):
+                method_count += 1
+                continue
+
+            attr_count += 1
+            if len(attrs) < cls.MAX_DICT_KEYS:
+                try:
                     attrs[name] = {
                         "type": type(value).__name__,
                         "value": cls._serialize_value(
                             value, max_len=cls.MAX_ATTR_VALUE_LENGTH
                         ),
                     }
-
-                    if len(attrs) >= cls.MAX_DICT_KEYS:
-                        break
                 except Exception:
                     pass
-        except Exception:
-            pass
 
-        return attrs
+        return attrs, attr_count, method_count
 
     @classmethod
-    def _get_object_metrics(cls, obj) -> Dict:
+    def _get_object_metrics(cls, obj, attr_count: int, method_count: int) -> Dict:
         """Get metrics for a generic object."""
         metrics = {
             "type": type(obj).__name__,
@@ -764,22 +910,8 @@ class ObjectParser(BaseParser):
         except Exception:
             pass
 
-        # Count attributes
-        try:
-            attrs = [
-                a
-                for a in dir(obj)
-                if not a.startswith("__") and not callable(getattr(obj, a, None))
-            ]
-            methods = [
-                m
-                for m in dir(obj)
-                if not m.startswith("__") and callable(getattr(obj, m, None))
-            ]
-            metrics["attribute_count"] = len(attrs)
-            metrics["method_count"] = len(methods)
-        except Exception:
-            pass
+        metrics["attribute_count"] = attr_count
+        metrics["method_count"] = method_count
 
         # Check for common interfaces
         metrics["interfaces"] = []
@@ -800,37 +932,52 @@ class ObjectParser(BaseParser):
 
     @classmethod
     def _get_source_info(cls, obj) -> Optional[Dict]:
-        """Try to get source file info for the object's class."""
+        """
+        Try to get source file info for the object's class.
+
+        Cached per type, since inspect.getsourcelines reads and tokenizes the
+        whole source file. The returned dict is shared and must not be mutated.
+        """
+        cls_type = type(obj)
         try:
-            cls_type = type(obj)
-            source_info = {}
+            return _SOURCE_INFO_CACHE[cls_type]
+        except (KeyError, TypeError):
+            pass
 
-            try:
-                source_info["file"] = inspect.getfile(cls_type)
-            except Exception:
-                pass
+        source_info = cls._type_source_info(cls_type)
+        try:
+            _SOURCE_INFO_CACHE[cls_type] = source_info
+        except TypeError:
+            pass
+        return source_info
 
-            try:
-                source_info["source_lines"] = len(inspect.getsourcelines(cls_type)[0])
-            except Exception:
-                pass
+    @staticmethod
+    def _type_source_info(cls_type) -> Optional[Dict]:
+        """Uncached source file, length and bases for a class."""
+        source_info = {}
 
-            # Get class hierarchy
-            try:
-                mro = [
-                    c.__name__ for c in cls_type.__mro__[1:-1]
-                ]  # Skip self and object
-                if mro:
-                    source_info["bases"] = mro
-            except Exception:
-                pass
+        try:
+            source_info["file"] = inspect.getfile(cls_type)
+        except Exception:
+            pass
 
-            return source_info if source_info else None
+        try:
+            source_info["source_lines"] = len(inspect.getsourcelines(cls_type)[0])
         except Exception:
-            return None
+            pass
+
+        # Get class hierarchy
+        try:
+            mro = [c.__name__ for c in cls_type.__mro__[1:-1]]  # Skip self and object
+            if mro:
+                source_info["bases"] = mro
+        except Exception:
+            pass
+
+        return source_info if source_info else None
 
     @classmethod
-    def _serialize_object(cls, obj) -> str:
+    def _serialize_object(cls, obj) -> Dict:
         """Create trimmed serialization of generic object."""
         try:
             # Try repr first
@@ -838,14 +985,12 @@ class ObjectParser(BaseParser):
             if len(repr_str) > cls.MAX_STRING_LENGTH:
                 repr_str = repr_str[: cls.MAX_STRING_LENGTH] + "..."
 
-            return json.dumps(
-                {
-                    "repr": repr_str,
-                    "type": type(obj).__name__,
-                }
-            )
+            return {
+                "repr": repr_str,
+                "type": type(obj).__name__,
+            }
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return {"error": str(e)}
 
     # ========== UTILITY METHODS ==========
 
@@ -881,6 +1026,13 @@ class ObjectParser(BaseParser):
         except Exception:
             return "<unserializable>"
 
+    @classmethod
+    def _stats_step(cls, count: int, dims: int = 1) -> int:
+        """Stride per axis that keeps a `dims`-axis sample under MAX_STATS_ELEMENTS."""
+        if count <= cls.MAX_STATS_ELEMENTS:
+            return 1
+        return math.ceil((count / cls.MAX_STATS_ELEMENTS) ** (1 / dims))
+
     @classmethod
     def _estimate_size(cls, obj) -> str:
         """Estimate memory size of object."""
@@ -910,13 +1062,6 @@ class ObjectParser(BaseParser):
             num /= 1000
         return f"{num:.1f}P"
 
-    @classmethod
-    def detect_output(cls, content: str) -> bool:
-        """Check if content has object output marker."""
-        if not isinstance(content, str):
-            return False
-        return content.startswith(cls.OUTPUT_MARKER)
-
     @classmethod
     def parse_output(cls, content: str, logger=None) -> dict:
         """Parse object output - typically just pass through."""
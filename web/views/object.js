@@ -486,12 +486,17 @@ class ObjectView extends BaseView {
   static renderSerialized(serialized) {
     const id = `serial-${Math.random().toString(36).slice(2, 9)}`;
     
+    // Current backends send structured data; older outputs sent a JSON string
     let displayContent;
-    try {
-      const parsed = JSON.parse(serialized);
-      displayContent = JSON.stringify(parsed, null, 2);
-    } catch {
-      displayContent = serialized;
+    if (typeof serialized !== "string") {
+      displayContent = JSON.stringify(serialized, null, 2);
+    } else {
+      try {
+        const parsed = JSON.parse(serialized);
+        displayContent = JSON.stringify(parsed, null, 2);
+      } catch {
+        displayContent = serialized;
+      }
     }
 
     // Truncate if too long